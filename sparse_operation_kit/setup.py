@@ -14,6 +14,8 @@
  limitations under the License.
 """
 import os
+import shutil
+import subprocess
 import sys
 
 # import tensorflow as tf
@@ -41,6 +43,13 @@ def _GetSOKVersion():
     return version
 
 
+def _GetBuildJobs():
+    max_jobs = os.cpu_count()
+    if os.getenv("MAX_JOBS"):
+        max_jobs = int(os.getenv("MAX_JOBS"))
+    return max_jobs
+
+
 def get_cmake_args():
     gpu_capabilities = ["70", "75", "80", "90"]
     if os.getenv("SOK_COMPILE_GPU_SM"):
@@ -73,20 +82,37 @@ def get_cmake_args():
     if os.getenv("PYTHONPATH"):
         env_python_path = os.getenv("PYTHONPATH")
 
+    # nvcc serializes the per-architecture device passes of each .cu file
+    # unless told otherwise; "--threads 0" lets it use one thread per pass.
+    nvcc_threads = "0"
+    if os.getenv("NVCC_THREADS"):
+        nvcc_threads = str(int(os.getenv("NVCC_THREADS")))
+
     enable_deeprec = "OFF"
     if os.getenv("ENABLE_DEEPREC"):
         enable_deeprec = (
             "OFF" if os.getenv("ENABLE_DEEPREC") in ["0", "OFF", "Off", "off"] else "ON"
         )
+
+    # Wrap the compilers with sccache/ccache when available so rebuilds reuse
+    # cached nvcc/gcc objects; set SOK_COMPILE_USE_CCACHE=OFF to opt out.
+    compiler_launcher = ""
+    if os.getenv("SOK_COMPILE_USE_CCACHE", "ON") not in ["0", "OFF", "Off", "off"]:
+        compiler_launcher = shutil.which("sccache") or shutil.which("ccache") or ""
+
     cmake_args = [
         "-DSM='{}'".format(";".join(gpu_capabilities)),
         "-DUSE_NVTX={}".format(use_nvtx),
         "-DSOK_ASYNC={}".format(dedicated_cuda_stream),
         "-DSOK_UNIT_TEST={}".format(unit_test),
         "-DCMAKE_BUILD_TYPE={}".format(cmake_build_type),
+        "-DCMAKE_CUDA_FLAGS=--threads={}".format(nvcc_threads),
         "-DENV_PYTHONPATH={}".format(env_python_path),
         "-DENABLE_DEEPREC={}".format(enable_deeprec),
     ]
+    if compiler_launcher:
+        cmake_args.append("-DCMAKE_CXX_COMPILER_LAUNCHER={}".format(compiler_launcher))
+        cmake_args.append("-DCMAKE_CUDA_COMPILER_LAUNCHER={}".format(compiler_launcher))
     return cmake_args
 
 
@@ -94,11 +120,38 @@ def get_cmake_args():
 # the parent folder(i.e. HugeCTR) when using skbuild to make pip package,
 # so we use a workaround here: copy the content of parent folder into
 # sparse_operation_kit/ before making pip package.
-os.system("cp -r ../HugeCTR ./")
-os.system("cp -r ../gpu_cache ./")
-os.system("mkdir third_party")
-os.system("cp -r ../third_party/json ./third_party/")
-os.system("cp -r ../third_party/HierarchicalKV ./third_party/")
+# scikit-build drives the native build through "cmake --build", which honors
+# CMAKE_BUILD_PARALLEL_LEVEL; default it to MAX_JOBS (or all cores) so the
+# compile saturates the machine instead of running with the generator default.
+os.environ.setdefault("CMAKE_BUILD_PARALLEL_LEVEL", str(_GetBuildJobs()))
+
+# scikit-build already reuses the CMake cache in _skbuild/ across invocations,
+# but unconditionally re-copying the sources refreshed every timestamp and made
+# each install pay a full recompile. Copy only files newer than their
+# destination (-u) so a no-op install reduces to an incremental build;
+# SOK_FORCE_RECONFIGURE=1 restores the unconditional copy.
+# When installing from the sdist (pip install sparse_operation_kit) the parent
+# tree does not exist, but MANIFEST.in already grafted these directories into
+# the package root, so absent sources are simply skipped.
+def _CopyParentSources():
+    copy_flags = ["-r"] if os.getenv("SOK_FORCE_RECONFIGURE") == "1" else ["-r", "-u"]
+    stages = [
+        ("../HugeCTR", "./"),
+        ("../gpu_cache", "./"),
+        ("../third_party/json", "./third_party/"),
+        ("../third_party/HierarchicalKV", "./third_party/"),
+    ]
+    for source_dir, dest_dir in stages:
+        if not os.path.isdir(source_dir):
+            continue
+        try:
+            os.makedirs(dest_dir, exist_ok=True)
+            subprocess.check_call(["cp"] + copy_flags + [source_dir, dest_dir])
+        except subprocess.CalledProcessError as error:
+            raise RuntimeError("SOK setup failed to copy {}".format(source_dir)) from error
+
+
+_CopyParentSources()
 
 
 setup(